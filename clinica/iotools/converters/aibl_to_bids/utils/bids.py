@@ -149,6 +149,7 @@ def paths_to_bids(
         index=False,
         sep="\t",
         encoding="utf-8",
+        lineterminator="\n",
     )
     images_list = list([data for _, data in images.iterrows()])
     create_file_ = partial(
@@ -209,10 +210,9 @@ def _get_first_file_matching_pattern(folder: Path, pattern: str) -> Path:
     """
     if pattern == "":
         raise ValueError("Pattern is not valid.")
-    try:
-        return sorted([f for f in folder.glob(pattern)])[0]
-    except IndexError:
+    if (first_file := min(folder.glob(pattern), default=None)) is None:
         raise ValueError(f"No file matching pattern {folder}/{pattern}.")
+    return first_file
 
 
 def _listdir_nohidden(folder: Path) -> List[str]:
@@ -228,11 +228,14 @@ def _listdir_nohidden(folder: Path) -> List[str]:
     list of str:
         Names of subdirectories found within provided folder.
     """
-    return [
-        str(file.name)
-        for file in folder.iterdir()
-        if file.is_dir() and not file.name.startswith(".")
-    ]
+    from os import scandir
+
+    with scandir(folder) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
 
 
 def _find_path_to_t1_adni(
@@ -1,15 +1,20 @@
+import re
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Type
 
 import numpy as np
 import pandas as pd
 
+from clinica.iotools.bids_utils import BIDSSubjectID
+
 __all__ = [
     "create_participants_tsv_file",
     "create_scans_tsv_file",
     "create_sessions_tsv_file",
 ]
 
+_YEAR_OF_BIRTH_PATTERN = re.compile(r"/(\d{4})")
+
 
 def create_participants_tsv_file(
     input_path: Path,
@@ -36,18 +41,16 @@ def create_participants_tsv_file(
         available in the BIDS dataset.
         Default=True.
     """
-    import glob
     import os
-    from os import path
 
     import numpy as np
 
     from clinica.iotools.bids_utils import StudyName, bids_id_factory
 
+    clinical_data_files = _list_clinical_data_files(clinical_data_dir)
     fields_bids = ["participant_id"]
     fields_dataset = []
-    prev_location = ""
-    prev_sheet = ""
+    clinical_data = {}
     index_to_drop = []
 
     specifications = _load_specifications(
@@ -63,9 +66,7 @@ def create_participants_tsv_file(
             fields_bids.append(participant_fields_bids[i])
             fields_dataset.append(participant_fields_db[i])
 
-    # Init the dataframe that will be saved in the file participant.tsv
-    participant_df = pd.DataFrame(columns=fields_bids)
-
+    participant_columns = {}
     for i in range(0, len(participant_fields_db)):
         # If a field not empty is found
         if not pd.isnull(participant_fields_db[i]):
@@ -74,50 +75,49 @@ def create_participants_tsv_file(
             location = tmp[0]
             # If a sheet is available
             sheet = tmp[1] if len(tmp) > 1 else ""
-            # Check if the file to open for a certain field it's the same of the previous field
-            if location == prev_location and sheet == prev_sheet:
-                pass
-            else:
+            # Read each file (and sheet) only once, even if its fields are not contiguous
+            if (location, sheet) not in clinical_data:
                 file_ext = os.path.splitext(location)[1]
-                file_to_read_path = path.join(clinical_data_dir, location)
+                file_to_read_path = _find_clinical_data_file(
+                    clinical_data_files, location
+                )
 
                 if file_ext == ".xlsx":
-                    file_to_read = pd.read_excel(
-                        glob.glob(file_to_read_path)[0], sheet_name=sheet
+                    clinical_data[(location, sheet)] = pd.read_excel(
+                        file_to_read_path, sheet_name=sheet
                     )
                 elif file_ext == ".csv":
-                    file_to_read = pd.read_csv(glob.glob(file_to_read_path)[0])
-                prev_location = location
-                prev_sheet = sheet
-
-            field_col_values = []
-            # For each field in fields_dataset extract all the column values
-            for j in range(0, len(file_to_read)):
-                # Convert the alternative_id_1 to string if is an integer/float
-                if participant_fields_bids[i] == "alternative_id_1" and (
-                    file_to_read[participant_fields_db[i]].dtype == np.float64
-                    or file_to_read[participant_fields_db[i]].dtype == np.int64
-                ):
-                    if not pd.isnull(file_to_read.at[j, participant_fields_db[i]]):
-                        # value_to_append = str(file_to_read.get_value(j, participant_fields_db[i])).rstrip('.0')
-                        value_to_append = str(
-                            file_to_read.at[j, participant_fields_db[i]]
-                        )
-                    else:
-                        value_to_append = "n/a"
-                else:
-                    value_to_append = file_to_read.at[j, participant_fields_db[i]]
-                field_col_values.append(value_to_append)
-            # Add the extracted column to the participant_df
-            participant_df[participant_fields_bids[i]] = pd.Series(field_col_values)
+                    clinical_data[(location, sheet)] = pd.read_csv(file_to_read_path)
+            file_to_read = clinical_data[(location, sheet)]
+
+            field_col_values = file_to_read[participant_fields_db[i]].reset_index(
+                drop=True
+            )
+            # Convert the alternative_id_1 to string if is an integer/float
+            if participant_fields_bids[i] == "alternative_id_1" and (
+                field_col_values.dtype == np.float64
+                or field_col_values.dtype == np.int64
+            ):
+                field_col_values = field_col_values.astype(str).where(
+                    field_col_values.notna(), "n/a"
+                )
+            participant_columns[participant_fields_bids[i]] = field_col_values
+
+    # Build the dataframe that will be saved in the file participant.tsv
+    # Its rows are the ones of the first field extracted
+    participant_df = pd.DataFrame(
+        participant_columns,
+        index=participant_columns[fields_bids[1]].index,
+        columns=fields_bids,
+    )
 
     # Compute BIDS-compatible participant ID.
-    participant_df["participant_id"] = participant_df["alternative_id_1"].apply(
-        lambda x: bids_id_factory(StudyName.AIBL).from_original_study_id(x)
+    participant_df["participant_id"] = participant_df["alternative_id_1"].map(
+        bids_id_factory(StudyName.AIBL).from_original_study_id
     )
     # Keep year-of-birth only.
     participant_df["date_of_birth"] = participant_df["date_of_birth"].str.extract(
-        r"/(\d{4}).*"
+        _YEAR_OF_BIRTH_PATTERN
     )
     # Normalize sex value.
     participant_df["sex"] = participant_df["sex"].map({1: "M", 2: "F"}).fillna("n/a")
@@ -129,12 +129,41 @@ def create_participants_tsv_file(
     if delete_non_bids_info:
         participant_df = participant_df.drop(index_to_drop)
 
-    participant_df.to_csv(
-        input_path / "participants.tsv",
-        sep="\t",
-        index=False,
-        encoding="utf8",
-    )
+    _write_tsv(participant_df, input_path / "participants.tsv")
+
+
+def _write_tsv(df: pd.DataFrame, tsv_file: Path) -> None:
+    """Write the provided dataframe, without its index, to a TSV file.
+
+    Lines always end with a line feed, whatever the platform.
+    """
+    df.to_csv(tsv_file, sep="\t", index=False, encoding="utf8", lineterminator="\n")
+
+
+def _list_clinical_data_files(clinical_data_dir: Path) -> Dict[str, Path]:
+    """Map the names of the files found in the clinical data folder to their path.
+
+    Hidden files are skipped, as they would be by a glob.
+    """
+    return {
+        file.name: file
+        for file in clinical_data_dir.iterdir()
+        if not file.name.startswith(".")
+    }
+
+
+def _find_clinical_data_file(
+    clinical_data_files: Dict[str, Path], pattern: str
+) -> Path:
+    """Return the first clinical data file whose name matches the provided pattern."""
+    import fnmatch
+
+    try:
+        return clinical_data_files[fnmatch.filter(clinical_data_files, pattern)[0]]
+    except IndexError:
+        raise FileNotFoundError(
+            f"Clinical data file corresponding to pattern {pattern} was not found."
+        )
 
 
 def _load_specifications(
@@ -149,43 +178,30 @@ def _load_specifications(
     return pd.read_csv(specifications, sep="\t")
 
 
-def _map_diagnosis(diagnosis: int) -> str:
-    if diagnosis == 1:
-        return "CN"
-    elif diagnosis == 2:
-        return "MCI"
-    elif diagnosis == 3:
-        return "AD"
-    else:
-        return "n/a"
+_DIAGNOSIS_MAPPING = {1: "CN", 2: "MCI", 3: "AD"}
 
 
 def _format_metadata_for_rid(
     input_df: pd.DataFrame, source_id: int, bids_metadata: str, source_metadata: str
 ) -> pd.DataFrame:
-    from clinica.iotools.converter_utils import viscode_to_session
-
-    extract = input_df.loc[(input_df["RID"] == source_id), ["VISCODE", source_metadata]]
-    extract.rename(columns={source_metadata: bids_metadata}, inplace=True)
-    extract = extract.assign(
-        session_id=extract.VISCODE.apply(lambda x: viscode_to_session(x))
+    is_source_id = input_df["RID"].to_numpy() == source_id
+
+    return pd.DataFrame(
+        {bids_metadata: input_df[source_metadata].to_numpy()[is_source_id]},
+        index=pd.Index(
+            _map_viscodes_to_sessions(input_df["VISCODE"][is_source_id]),
+            name="session_id",
+        ),
     )
-    extract.drop(labels="VISCODE", inplace=True, axis=1)
-    extract.set_index("session_id", inplace=True, drop=True)
-
-    return extract
 
 
-def _compute_age_at_exam(
-    birth_date: Optional[str], exam_date: Optional[str]
-) -> Optional[int]:
-    from datetime import datetime
+def _map_viscodes_to_sessions(viscodes: pd.Series) -> pd.Series:
+    """Convert VISCODE values to session IDs, calling viscode_to_session once per distinct value."""
+    from clinica.iotools.converter_utils import viscode_to_session
 
-    if birth_date and exam_date:
-        date_of_birth = datetime.strptime(birth_date, "/%Y")
-        exam_date = datetime.strptime(exam_date, "%m/%d/%Y")
-        return exam_date.year - date_of_birth.year
-    return None
+    return viscodes.map(
+        {viscode: viscode_to_session(viscode) for viscode in viscodes.unique()}
+    )
 
 
 def _set_age_from_birth(df: pd.DataFrame) -> pd.DataFrame:
@@ -196,9 +212,10 @@ def _set_age_from_birth(df: pd.DataFrame) -> pd.DataFrame:
         )
     if len(df["date_of_birth"].dropna().unique()) <= 1:
         df["date_of_birth"] = df["date_of_birth"].ffill()
-        df["age"] = df.apply(
-            lambda x: _compute_age_at_exam(x.date_of_birth, x.examination_date), axis=1
-        )
+        birth_year = pd.to_datetime(df["date_of_birth"], format="/%Y").dt.year
+        exam_year = pd.to_datetime(df["examination_date"], format="%m/%d/%Y").dt.year
+        age = (exam_year - birth_year).astype("Int64")
+        df["age"] = age.astype(object).where(age.notna(), None).infer_objects()
     else:
         df["age"] = None
     return df.drop(labels="date_of_birth", axis=1)
@@ -208,6 +225,7 @@ def create_sessions_tsv_file(
     bids_dir: Path,
     clinical_data_dir: Path,
     clinical_specifications_folder: Path,
+    n_procs: Optional[int] = 1,
 ) -> None:
     """Extract the information regarding a subject sessions and save them in a tsv file.
 
@@ -221,11 +239,18 @@ def create_sessions_tsv_file(
 
     clinical_specifications_folder : Path
         The path to the folder containing the clinical specification files.
+
+    n_procs : int, optional
+        The requested number of processes.
+        If specified, it should be between 1 and the number of available CPUs.
+        Default=1.
     """
+    from functools import partial
+    from multiprocessing import Pool
+
     from clinica.iotools.bids_utils import (
         StudyName,
         bids_id_factory,
-        get_bids_sess_list,
         get_bids_subjs_list,
     )
 
@@ -233,85 +258,127 @@ def create_sessions_tsv_file(
     specifications = _load_specifications(
         clinical_specifications_folder, "sessions.tsv"
     )[["BIDS CLINICA", f"{study} location", study]].dropna()
+    clinical_data_files = _list_clinical_data_files(clinical_data_dir)
+    clinical_data = {
+        location: _load_clinical_data_file(
+            clinical_data_files, location, columns=list(fields)
+        )
+        for location, fields in specifications.groupby(f"{study} location")[study]
+    }
+    create_sessions_tsv_file_ = partial(
+        _create_sessions_tsv_file_for_subject,
+        bids_dir=bids_dir,
+        bids_id_class=bids_id_factory(StudyName.AIBL),
+        clinical_data=clinical_data,
+        metadata_fields=list(specifications.itertuples(index=False, name=None)),
+        alternative_exam_dates=_load_alternative_exam_dates(clinical_data_dir),
+    )
+    bids_ids = get_bids_subjs_list(bids_dir)
+    # If n_procs==1 do not rely on a Process Pool to enable classical debugging
+    if n_procs == 1:
+        for bids_id in bids_ids:
+            create_sessions_tsv_file_(bids_id)
+        return
+    with Pool(processes=n_procs) as pool:
+        pool.map(create_sessions_tsv_file_, bids_ids)
+
+
+def _create_sessions_tsv_file_for_subject(
+    bids_id: str,
+    bids_dir: Path,
+    bids_id_class: Type[BIDSSubjectID],
+    clinical_data: Dict[str, pd.DataFrame],
+    metadata_fields: List[Tuple[str, str, str]],
+    alternative_exam_dates: pd.Series,
+) -> None:
+    """Write the sessions TSV file of the provided subject.
 
-    for bids_id in get_bids_subjs_list(bids_dir):
-        rid = int(bids_id_factory(study)(bids_id).to_original_study_id())
-        sessions = pd.DataFrame(
-            {"session_id": get_bids_sess_list(bids_dir / bids_id)}
-        ).set_index("session_id", drop=False)
-
-        for _, row in specifications.iterrows():
-            try:
-                df = pd.read_csv(
-                    next(clinical_data_dir.glob(row[f"{study} location"])),
-                    dtype={"text": str},
-                )
-            except StopIteration:
-                raise FileNotFoundError(
-                    f"Clinical data file corresponding to pattern {row[f'{study} location']} was not found in folder "
-                    f"{clinical_data_dir}"
-                )
+    The metadata fields are (BIDS name, file location, AIBL name) triplets,
+    and the clinical data is the content of these files, indexed by location.
+    """
+    from clinica.iotools.bids_utils import get_bids_sess_list
 
-            data = _format_metadata_for_rid(
-                input_df=df,
+    rid = int(bids_id_class(bids_id).to_original_study_id())
+    sessions = [
+        pd.DataFrame({"session_id": get_bids_sess_list(bids_dir / bids_id)}).set_index(
+            "session_id", drop=False
+        )
+    ]
+    for bids_metadata, location, source_metadata in metadata_fields:
+        sessions.append(
+            _format_metadata_for_rid(
+                input_df=clinical_data[location],
                 source_id=rid,
-                bids_metadata=row["BIDS CLINICA"],
-                source_metadata=row[study],
+                bids_metadata=bids_metadata,
+                source_metadata=source_metadata,
             )
-            sessions = pd.concat([sessions, data], axis=1)
-
-        sessions.sort_index(inplace=True)
-
-        # -4 are considered missing values in AIBL
-        sessions.replace([-4, "-4", np.nan], None, inplace=True)
-        sessions["diagnosis"] = sessions.diagnosis.apply(lambda x: _map_diagnosis(x))
-        sessions["examination_date"] = sessions.apply(
-            lambda x: _complete_examination_dates(
-                rid, clinical_data_dir, x.session_id, x.examination_date
-            ),
-            axis=1,
-        )
-        sessions = _set_age_from_birth(sessions)
-
-        # in case there is a session in clinical data that was not actually converted
-        sessions.dropna(subset=["session_id"], inplace=True)
-        sessions.fillna("n/a", inplace=True)
-
-        bids_id = bids_id_factory(StudyName.AIBL).from_original_study_id(str(rid))
-        sessions.to_csv(
-            bids_dir / bids_id / f"{bids_id}_sessions.tsv",
-            sep="\t",
-            index=False,
-            encoding="utf8",
         )
+    sessions = pd.concat(sessions, axis=1)
+
+    sessions.sort_index(inplace=True)
+
+    # -4 are considered missing values in AIBL
+    sessions.replace([-4, "-4", np.nan], None, inplace=True)
+    sessions["diagnosis"] = sessions["diagnosis"].map(_DIAGNOSIS_MAPPING).fillna("n/a")
+    try:
+        subject_exam_dates = alternative_exam_dates.xs(rid, level="RID")
+    except KeyError:
+        subject_exam_dates = pd.Series(dtype=object)
+    sessions["examination_date"] = sessions["examination_date"].fillna(
+        sessions["session_id"].map(subject_exam_dates)
+    )
+    sessions = _set_age_from_birth(sessions)
 
+    # in case there is a session in clinical data that was not actually converted
+    sessions.dropna(subset=["session_id"], inplace=True)
+    sessions.fillna("n/a", inplace=True)
 
-def _complete_examination_dates(
-    rid: int,
-    clinical_data_dir: Path,
-    session_id: Optional[str] = None,
-    examination_date: Optional[str] = None,
-) -> Optional[str]:
-    if examination_date:
-        return examination_date
-    if session_id:
-        return _find_exam_date_in_other_csv_files(rid, session_id, clinical_data_dir)
-    return None
-
-
-def _find_exam_date_in_other_csv_files(
-    rid: int, session_id: str, clinical_data_dir: Path
-) -> Optional[str]:
-    """Try to find an alternative exam date by searching in other CSV files."""
-    from clinica.iotools.converter_utils import viscode_to_session
+    _write_tsv(sessions, bids_dir / bids_id / f"{bids_id}_sessions.tsv")
+
+
+def _load_clinical_data_file(
+    clinical_data_files: Dict[str, Path], pattern: str, columns: List[str]
+) -> pd.DataFrame:
+    """Read the RID, VISCODE and requested columns of the clinical CSV file matching pattern."""
+    return pd.read_csv(
+        _find_clinical_data_file(clinical_data_files, pattern),
+        usecols=["RID", "VISCODE", *columns],
+        dtype={"text": str},
+    )
 
+
+def _load_alternative_exam_dates(clinical_data_dir: Path) -> pd.Series:
+    """Return the alternative exam dates found in other CSV files, indexed by RID and session.
+
+    For a given (RID, session) pair, the date kept is the first one found, following
+    the order of the files returned by `_get_csv_files_for_alternative_exam_date`.
+    """
+    exam_dates = []
     for csv in _get_csv_files_for_alternative_exam_date(clinical_data_dir):
-        csv_data = pd.read_csv(csv, low_memory=False)
-        csv_data["SESSION"] = csv_data.VISCODE.apply(lambda x: viscode_to_session(x))
-        exam_date = csv_data[(csv_data.RID == rid) & (csv_data.SESSION == session_id)]
-        if not exam_date.empty and exam_date.iloc[0].EXAMDATE != "-4":
-            return exam_date.iloc[0].EXAMDATE
-    return None
+        csv_data = pd.read_csv(
+            csv,
+            usecols=["RID", "VISCODE", "EXAMDATE"],
+            dtype={"VISCODE": str, "EXAMDATE": str},
+        )
+        csv_data["SESSION"] = _map_viscodes_to_sessions(csv_data.VISCODE)
+        csv_data.drop_duplicates(subset=["RID", "SESSION"], inplace=True)
+        csv_data = csv_data.loc[
+            csv_data.RID.notna() & (csv_data.EXAMDATE != "-4"),
+            ["RID", "SESSION", "EXAMDATE"],
+        ]
+        if not csv_data.empty:
+            exam_dates.append(csv_data)
+    if not exam_dates:
+        return pd.Series(
+            index=pd.MultiIndex.from_arrays([[], []], names=["RID", "SESSION"]),
+            name="EXAMDATE",
+            dtype=object,
+        )
+    return (
+        pd.concat(exam_dates)
+        .drop_duplicates(subset=["RID", "SESSION"])
+        .set_index(["RID", "SESSION"])["EXAMDATE"]
+    )
 
 
 def _get_csv_files_for_alternative_exam_date(
@@ -356,6 +423,7 @@ def create_scans_tsv_file(
 
     import clinica.iotools.bids_utils as bids
 
+    clinical_data_files = _list_clinical_data_files(clinical_data_dir)
     specifications = _load_specifications(clinical_specifications_folder, "scans.tsv")
     scans_fields = specifications[bids.StudyName.AIBL.value]
     field_location = specifications[f"{bids.StudyName.AIBL.value} location"]
@@ -374,8 +442,9 @@ def create_scans_tsv_file(
     for i in range(0, len(scans_fields)):
         # If the i-th field is available
         if not pd.isnull(scans_fields[i]):
-            file_to_read_path = clinical_data_dir / field_location[i]
-            files_to_read.append(glob.glob(str(file_to_read_path))[0])
+            files_to_read.append(
+                _find_clinical_data_file(clinical_data_files, field_location[i])
+            )
             sessions_fields_to_read.append(scans_fields[i])
 
     bids_ids = [
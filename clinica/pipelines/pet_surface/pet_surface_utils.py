@@ -187,20 +187,15 @@ def make_label_conversion(gtmsegfile, csv):
     # Reading of csv file, raise exception if the pattern REGION, SOURCE, DST is not found
     if not os.path.isfile(csv):
         raise Exception("The CSV file does not exist.")
-    convert_lut = pandas.io.parsers.read_csv(csv, sep=",")
+    convert_lut = pandas.read_csv(csv, sep=",")
     if list(convert_lut.columns.values) != ["REGION", "SOURCE", "DST"]:
         raise Exception(
             f"CSV file {csv} is not in the correct format. Columns should be: REGION, SOURCE, DST"
         )
 
-    # Extract columns to a list form (values converted into integers)
-    src = list(convert_lut.SOURCE)
-    src_val = numpy.asanyarray(src)
-    src_val = src_val.astype("int")
-
-    dst = list(convert_lut.DST)
-    dst_val = numpy.asarray(dst)
-    dst_val = dst_val.astype("int")
+    # Extract columns to arrays (values converted into integers)
+    src_val = convert_lut.SOURCE.to_numpy(dtype=int)
+    dst_val = convert_lut.DST.to_numpy(dtype=int)
 
     reg = list(convert_lut.REGION)
 
@@ -218,7 +213,7 @@ def make_label_conversion(gtmsegfile, csv):
     # Instantiation of final volume, with same dtype as original volume
     new_volume = numpy.zeros(volume.shape, dtype=volume.dtype)
     # Computing the transformation
-    for i in range(len(src)):
+    for i in range(len(src_val)):
         new_volume[volume == src_val[i]] = dst_val[i]
         # cprint("Region " + reg[i] + " transformed")
     # Get unique list of new label
@@ -129,11 +129,12 @@ class StatisticsSurface(GroupPipeline):
         # Check input files
         surface_query = []
         # clinica_files_reader expects regexp to start at subjects/ so sub-*/ses-*/ is removed here
+        cut_pattern = "sub-*/ses-*/"
         fwhm = str(self.parameters["full_width_at_half_maximum"])
+        custom_file = self.parameters["custom_file"]
+        query = {"subject": "sub-*", "session": "ses-*", "fwhm": fwhm}
         for direction, hemi in zip(["left", "right"], ["lh", "rh"]):
-            cut_pattern = "sub-*/ses-*/"
-            query = {"subject": "sub-*", "session": "ses-*", "hemi": hemi, "fwhm": fwhm}
-            pattern_hemisphere = self.parameters["custom_file"] % query
+            pattern_hemisphere = custom_file % {**query, "hemi": hemi}
             surface_based_info = {
                 "pattern": pattern_hemisphere[
                     pattern_hemisphere.find(cut_pattern) + len(cut_pattern) :
@@ -1,6 +1,54 @@
 from typing import List
 
+import nipype.interfaces.io as nio
+import nipype.interfaces.utility as nutil
+import nipype.pipeline.engine as npe
+
 from clinica.pipelines.engine import GroupPipeline
+from clinica.pipelines.t1_volume_dartel2mni import (
+    t1_volume_dartel2mni_utils as dartel2mni_utils,
+)
+from clinica.utils.exceptions import ClinicaCAPSError, ClinicaException
+from clinica.utils.filemanip import unzip_nii, zip_nii
+from clinica.utils.input_files import (
+    t1_volume_deformation_to_template,
+    t1_volume_final_group_template,
+    t1_volume_native_tpm,
+)
+from clinica.utils.inputs import (
+    clinica_file_reader,
+    clinica_group_reader,
+    clinica_list_of_files_reader,
+    format_clinica_file_reader_errors,
+)
+from clinica.utils.spm import get_spm_tissue_from_index, use_spm_standalone_if_available
+from clinica.utils.stream import cprint
+from clinica.utils.ux import print_groups_in_caps_directory, print_images_to_process
+
+# Renaming rules of the output DataSink, shared by all pipeline instances.
+_REGEXP_SUBSTITUTIONS = [
+    *(
+        (
+            rf"(.*)c{index}(sub-.*)(\.nii(\.gz)?)$",
+            rf"\1\2_segm-{get_spm_tissue_from_index(index).value}_probability\3",
+        )
+        for index in range(1, 7)
+    ),
+    (
+        r"(.*)mw(sub-.*)_probability(\.nii(\.gz)?)$",
+        r"\1\2_space-Ixi549Space_modulated-on_probability\3",
+    ),
+    (
+        r"(.*)w(sub-.*)_probability(\.nii(\.gz)?)$",
+        r"\1\2_space-Ixi549Space_modulated-off_probability\3",
+    ),
+    (r"(.*)/normalized_files/(sub-.*)$", r"\1/\2"),
+    (
+        r"(.*)/smoothed_normalized_files/(fwhm-[0-9]+mm)_(sub-.*)_probability(\.nii(\.gz)?)$",
+        r"\1/\3_\2_probability\4",
+    ),
+    (r"trait_added", r""),
+]
 
 
 class T1VolumeDartel2MNI(GroupPipeline):
@@ -43,27 +91,6 @@ class T1VolumeDartel2MNI(GroupPipeline):
 
     def _build_input_node(self):
         """Build and connect an input node to the pipeline."""
-        import nipype.interfaces.utility as nutil
-        import nipype.pipeline.engine as npe
-
-        from clinica.utils.exceptions import ClinicaCAPSError, ClinicaException
-        from clinica.utils.input_files import (
-            t1_volume_deformation_to_template,
-            t1_volume_final_group_template,
-            t1_volume_native_tpm,
-        )
-        from clinica.utils.inputs import (
-            clinica_file_reader,
-            clinica_group_reader,
-            clinica_list_of_files_reader,
-            format_clinica_file_reader_errors,
-        )
-        from clinica.utils.stream import cprint
-        from clinica.utils.ux import (
-            print_groups_in_caps_directory,
-            print_images_to_process,
-        )
-
         if not self.group_directory.exists():
             print_groups_in_caps_directory(self.caps_directory)
             raise ClinicaException(
@@ -94,10 +121,9 @@ class T1VolumeDartel2MNI(GroupPipeline):
             # Tissues_input has a length of len(self.parameters['mask_tissues']). Each of these elements has a size of
             # len(self.subjects). We want the opposite : a list of size len(self.subjects) whose elements have a size of
             # len(self.parameters['mask_tissues']. The trick is to iter on elements with zip(*my_list)
-            tissues_input_rearranged = []
-            for subject_tissue_list in zip(*tissues_input):
-                tissues_input_rearranged.append(subject_tissue_list)
-                read_input_node.inputs.native_segmentations = tissues_input_rearranged
+            read_input_node.inputs.native_segmentations = list(
+                map(list, zip(*tissues_input))
+            )
         except ClinicaException as e:
             all_errors.append(e)
 
@@ -122,7 +148,7 @@ class T1VolumeDartel2MNI(GroupPipeline):
         except ClinicaException as e:
             all_errors.append(e)
 
-        if any(all_errors):
+        if all_errors:
             error_message = "Clinica faced error(s) while trying to read files in your CAPS/BIDS directories.\n"
             for msg in all_errors:
                 error_message += str(msg)
@@ -148,11 +174,6 @@ class T1VolumeDartel2MNI(GroupPipeline):
 
     def _build_output_node(self):
         """Build and connect an output node to the pipeline."""
-        import nipype.interfaces.io as nio
-        import nipype.pipeline.engine as npe
-
-        from clinica.utils.filemanip import zip_nii
-
         write_normalized_node = npe.MapNode(
             name="write_normalized_node",
             iterfield=["container", "normalized_files", "smoothed_normalized_files"],
@@ -162,36 +183,12 @@ class T1VolumeDartel2MNI(GroupPipeline):
         )
         write_normalized_node.inputs.base_directory = str(self.caps_directory)
         write_normalized_node.inputs.parameterization = False
+        group_id = self.group_id
         write_normalized_node.inputs.container = [
-            "subjects/"
-            + self.subjects[i]
-            + "/"
-            + self.sessions[i]
-            + f"/t1/spm/dartel/{self.group_id}"
-            for i in range(len(self.subjects))
-        ]
-        write_normalized_node.inputs.regexp_substitutions = [
-            (r"(.*)c1(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-graymatter_probability\3"),
-            (r"(.*)c2(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-whitematter_probability\3"),
-            (r"(.*)c3(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-csf_probability\3"),
-            (r"(.*)c4(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-bone_probability\3"),
-            (r"(.*)c5(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-softtissue_probability\3"),
-            (r"(.*)c6(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-background_probability\3"),
-            (
-                r"(.*)mw(sub-.*)_probability(\.nii(\.gz)?)$",
-                r"\1\2_space-Ixi549Space_modulated-on_probability\3",
-            ),
-            (
-                r"(.*)w(sub-.*)_probability(\.nii(\.gz)?)$",
-                r"\1\2_space-Ixi549Space_modulated-off_probability\3",
-            ),
-            (r"(.*)/normalized_files/(sub-.*)$", r"\1/\2"),
-            (
-                r"(.*)/smoothed_normalized_files/(fwhm-[0-9]+mm)_(sub-.*)_probability(\.nii(\.gz)?)$",
-                r"\1/\3_\2_probability\4",
-            ),
-            (r"trait_added", r""),
+            f"subjects/{subject}/{session}/t1/spm/dartel/{group_id}"
+            for subject, session in zip(self.subjects, self.sessions)
         ]
+        write_normalized_node.inputs.regexp_substitutions = _REGEXP_SUBSTITUTIONS
 
         self.connect(
             [
@@ -212,18 +209,14 @@ class T1VolumeDartel2MNI(GroupPipeline):
     def _build_core_nodes(self):
         """Build and connect the core nodes of the pipeline."""
         import nipype.interfaces.spm as spm
-        import nipype.interfaces.utility as nutil
-        import nipype.pipeline.engine as npe
-
-        from clinica.utils.filemanip import unzip_nii
-        from clinica.utils.spm import use_spm_standalone_if_available
-
-        from ..t1_volume_dartel2mni import (
-            t1_volume_dartel2mni_utils as dartel2mni_utils,
-        )
 
         use_spm_standalone_if_available()
 
+        tissues = self.parameters["tissues"]
+        voxel_size = self.parameters["voxel_size"]
+        modulate = self.parameters["modulate"]
+        smooth = self.parameters["smooth"]
+
         unzip_tissues_node = npe.MapNode(
             nutil.Function(
                 input_names=["in_file"], output_names=["out_file"], function=unzip_nii
@@ -252,22 +245,19 @@ class T1VolumeDartel2MNI(GroupPipeline):
             name="dartel2MNI",
             iterfield=["apply_to_files", "flowfield_files"],
         )
-        if self.parameters["voxel_size"] is not None:
-            dartel2mni_node.inputs.voxel_size = tuple(self.parameters["voxel_size"])
-        dartel2mni_node.inputs.modulate = self.parameters["modulate"]
+        if voxel_size is not None:
+            dartel2mni_node.inputs.voxel_size = tuple(voxel_size)
+        dartel2mni_node.inputs.modulate = modulate
         dartel2mni_node.inputs.fwhm = 0
 
-        if self.parameters["smooth"] is not None and len(self.parameters["smooth"]) > 0:
+        if smooth:
             smoothing_node = npe.MapNode(
                 spm.Smooth(), name="smoothing_node", iterfield=["in_files"]
             )
 
             smoothing_node.iterables = [
-                ("fwhm", [[x, x, x] for x in self.parameters["smooth"]]),
-                (
-                    "out_prefix",
-                    ["fwhm-" + str(x) + "mm_" for x in self.parameters["smooth"]],
-                ),
+                ("fwhm", [[x, x, x] for x in smooth]),
+                ("out_prefix", [f"fwhm-{x}mm_" for x in smooth]),
             ]
             smoothing_node.synchronize = True
 
@@ -325,7 +315,7 @@ class T1VolumeDartel2MNI(GroupPipeline):
                             (
                                 "out_file",
                                 dartel2mni_utils.prepare_flowfields,
-                                self.parameters["tissues"],
+                                tissues,
                             ),
                             "flowfield_files",
                         )
@@ -1,5 +1,7 @@
 def prepare_flowfields(flow_fields, tissues):
-    return [[f] * len(tissues) for f in flow_fields]
+    """Repeat each subject flow field once per tissue."""
+    number_of_tissues = len(tissues)
+    return [[f] * number_of_tissues for f in flow_fields]
 
 
 def join_smoothed_files(smoothed_normalized_files):
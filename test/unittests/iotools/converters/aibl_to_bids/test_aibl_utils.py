@@ -1,41 +1,11 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
 
-@pytest.mark.parametrize(
-    "birth_date, exam_date, expected",
-    [(None, "foo", None), ("foo", None, None), ("/2000", "01/01/2012", 12)],
-)
-def test_compute_age_at_exam(birth_date, exam_date, expected):
-    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
-        _compute_age_at_exam,
-    )
-
-    assert _compute_age_at_exam(birth_date, exam_date) == expected
-
-
-@pytest.mark.parametrize(
-    "diagnosis, expected",
-    [
-        (-4, "n/a"),
-        (1, "CN"),
-        (2, "MCI"),
-        (3, "AD"),
-        (0, "n/a"),
-        (None, "n/a"),
-    ],
-)
-def test_map_diagnosis(diagnosis, expected):
-    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
-        _map_diagnosis,
-    )
-
-    assert _map_diagnosis(diagnosis) == expected
-
-
 def test_load_specifications_success(tmp_path):
     from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
         _load_specifications,
@@ -101,6 +71,27 @@ def test_get_first_file_matching_pattern_error(tmp_path, pattern, msg):
         _get_first_file_matching_pattern(tmp_path, pattern)
 
 
+def test_find_clinical_data_file(tmp_path):
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        _find_clinical_data_file,
+        _list_clinical_data_files,
+    )
+
+    (tmp_path / "aibl_ptdemog_230ct2024.csv").touch()
+    (tmp_path / "aibl_cdr_230ct2024.csv").touch()
+    (tmp_path / ".aibl_mmse_230ct2024.csv").touch()
+    clinical_data_files = _list_clinical_data_files(tmp_path)
+
+    assert (
+        _find_clinical_data_file(clinical_data_files, "aibl_ptdemog_*.csv")
+        == tmp_path / "aibl_ptdemog_230ct2024.csv"
+    )
+    with pytest.raises(FileNotFoundError, match="aibl_mmse_"):
+        _find_clinical_data_file(clinical_data_files, "aibl_mmse_*.csv")
+    with pytest.raises(FileNotFoundError, match="mmse"):
+        _find_clinical_data_file(clinical_data_files, "*mmse*.csv")
+
+
 def build_sessions_spec(tmp_path: Path) -> Path:
     spec = pd.DataFrame(
         {
@@ -230,12 +221,17 @@ def build_clinical_data(tmp_path: Path) -> Path:
     return data_path
 
 
-def test_extract_metadata_df(tmp_path):
+@pytest.fixture(scope="session")
+def clinical_data_dir(tmp_path_factory) -> Path:
+    """Clinical data folder shared by the tests which only read from it."""
+    return build_clinical_data(tmp_path_factory.mktemp("aibl"))
+
+
+def test_extract_metadata_df(clinical_data_dir):
     from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
         _format_metadata_for_rid,
     )
 
-    clinical_dir = build_clinical_data(tmp_path)
     expected = pd.DataFrame(
         {
             "session_id": ["ses-M000", "ses-M006"],
@@ -243,7 +239,9 @@ def test_extract_metadata_df(tmp_path):
         }
     ).set_index("session_id", drop=True)
     result = _format_metadata_for_rid(
-        pd.read_csv(clinical_dir / "aibl_neurobat_230ct2024.csv", dtype={"text": str}),
+        pd.read_csv(
+            clinical_data_dir / "aibl_neurobat_230ct2024.csv", dtype={"text": str}
+        ),
         109,
         bids_metadata="examination_date",
         source_metadata="EXAMDATE",
@@ -252,28 +250,7 @@ def test_extract_metadata_df(tmp_path):
     assert_frame_equal(expected, result)
 
 
-@pytest.mark.parametrize(
-    "source_id, session_id, expected",
-    [
-        (109, "ses-M000", "01/01/2109"),
-        (109, "ses-M006", None),
-        (109, "ses-M014", None),
-        (0, "ses-M014", None),
-    ],
-)
-def test_find_exam_date_in_other_csv_files(tmp_path, source_id, session_id, expected):
-    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
-        _find_exam_date_in_other_csv_files,
-    )
-
-    clinical_dir = build_clinical_data(tmp_path)
-    assert (
-        _find_exam_date_in_other_csv_files(source_id, session_id, clinical_dir)
-        == expected
-    )
-
-
-def test_get_csv_files_for_alternative_exam_date(tmp_path):
+def test_get_csv_files_for_alternative_exam_date(tmp_path, clinical_data_dir):
     from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
         _get_csv_files_for_alternative_exam_date,
     )
@@ -284,10 +261,9 @@ def test_get_csv_files_for_alternative_exam_date(tmp_path):
 
     assert csv_paths == []
 
-    clinical_dir = build_clinical_data(tmp_path)
     csv_paths = [
         Path(path).name
-        for path in _get_csv_files_for_alternative_exam_date(clinical_dir)
+        for path in _get_csv_files_for_alternative_exam_date(clinical_data_dir)
     ]
 
     assert set(csv_paths) == {
@@ -297,27 +273,54 @@ def test_get_csv_files_for_alternative_exam_date(tmp_path):
     }
 
 
-@pytest.mark.parametrize(
-    "rid, session_id, exam_date, expected",
-    [
-        (0, "foo", "01/01/2000", "01/01/2000"),
-        (0, None, "01/01/2000", "01/01/2000"),
-        (0, None, None, None),
-        (109, "ses-M000", None, "01/01/2109"),
-        (109, "ses-M006", None, None),
-    ],
-)
-def test_complete_examination_dates(tmp_path, rid, session_id, exam_date, expected):
+def test_load_alternative_exam_dates(tmp_path, clinical_data_dir):
     from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
-        _complete_examination_dates,
+        _load_alternative_exam_dates,
     )
 
-    clinical_dir = build_clinical_data(tmp_path)
-    assert (
-        _complete_examination_dates(rid, clinical_dir, session_id, exam_date)
-        == expected
+    assert _load_alternative_exam_dates(tmp_path).empty
+
+    exam_dates = _load_alternative_exam_dates(clinical_data_dir)
+
+    assert exam_dates.to_dict() == {
+        (1, "ses-M000"): "01/01/2001",
+        (2, "ses-M000"): "01/01/2002",
+        (12, "ses-M000"): "01/01/2012",
+        (100, "ses-M000"): "01/01/2100",
+        (100, "ses-M012"): "12/01/2100",
+        (109, "ses-M000"): "01/01/2109",
+    }
+    # An exam date of -4 is skipped.
+    assert (109, "ses-M006") not in exam_dates.index
+
+
+def test_load_alternative_exam_dates_with_float_rid(tmp_path):
+    import warnings
+
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        _load_alternative_exam_dates,
     )
 
+    pd.DataFrame(
+        {
+            "RID": [1, np.nan],
+            "VISCODE": ["bl", "bl"],
+            "EXAMDATE": ["01/01/2001", "01/01/2002"],
+        }
+    ).to_csv(tmp_path / "aibl_mri3meta_230ct2024.csv", index=False)
+    pd.DataFrame({"RID": [2], "VISCODE": ["bl"], "EXAMDATE": ["01/01/2003"]}).to_csv(
+        tmp_path / "aibl_cdr_230ct2024.csv", index=False
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        exam_dates = _load_alternative_exam_dates(tmp_path)
+
+    assert exam_dates.to_dict() == {
+        (1, "ses-M000"): "01/01/2001",
+        (2, "ses-M000"): "01/01/2003",
+    }
+
 
 @pytest.mark.parametrize(
     "input_df, expected_df",
@@ -355,6 +358,17 @@ def test_complete_examination_dates(tmp_path, rid, session_id, exam_date, expect
                 {"age": [None, None], "examination_date": ["01/01/2024", "01/01/2026"]}
             ),
         ),
+        (
+            pd.DataFrame(
+                {
+                    "date_of_birth": ["/2000", None],
+                    "examination_date": ["01/01/2024", None],
+                }
+            ),
+            pd.DataFrame(
+                {"age": [24.0, np.nan], "examination_date": ["01/01/2024", None]}
+            ),
+        ),
     ],
 )
 def test_set_age_from_birth_success(input_df, expected_df):
@@ -386,7 +400,28 @@ def test_set_age_from_birth_raise(input_df):
         _set_age_from_birth(input_df)
 
 
-def test_create_sessions_tsv(tmp_path):
+@pytest.mark.parametrize(
+    "date_of_birth, examination_date",
+    [("/2000", "2024-01-01"), ("2000", "01/01/2024")],
+)
+def test_set_age_from_birth_unparsable_date(date_of_birth, examination_date):
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        _set_age_from_birth,
+    )
+
+    with pytest.raises(ValueError):
+        _set_age_from_birth(
+            pd.DataFrame(
+                {
+                    "date_of_birth": [date_of_birth],
+                    "examination_date": [examination_date],
+                }
+            )
+        )
+
+
+@pytest.mark.parametrize("n_procs", [1, 2])
+def test_create_sessions_tsv(tmp_path, clinical_data_dir, n_procs):
     from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
         create_sessions_tsv_file,
     )
@@ -395,20 +430,25 @@ def test_create_sessions_tsv(tmp_path):
 
     create_sessions_tsv_file(
         bids_dir=bids_path,
-        clinical_data_dir=build_clinical_data(tmp_path),
+        clinical_data_dir=clinical_data_dir,
         clinical_specifications_folder=build_sessions_spec(tmp_path),
+        n_procs=n_procs,
+    )
+    result_sub109 = pd.read_csv(
+        bids_path / "sub-AIBL109" / "sub-AIBL109_sessions.tsv",
+        sep="\t",
+        keep_default_na=False,
+    )
+    result_sub100 = pd.read_csv(
+        bids_path / "sub-AIBL100" / "sub-AIBL100_sessions.tsv",
+        sep="\t",
+        keep_default_na=False,
+    )
+    result_sub1 = pd.read_csv(
+        bids_path / "sub-AIBL1" / "sub-AIBL1_sessions.tsv",
+        sep="\t",
+        keep_default_na=False,
     )
-    result_sub100_list = list(bids_path.rglob("*sub-AIBL100_sessions.tsv"))
-    result_sub1_list = list(bids_path.rglob("*sub-AIBL1_sessions.tsv"))
-    result_sub109_list = list(bids_path.rglob("*sub-AIBL109_sessions.tsv"))
-
-    assert len(result_sub109_list) == 1
-    assert len(result_sub100_list) == 1
-    assert len(result_sub1_list) == 1
-
-    result_sub109 = pd.read_csv(result_sub109_list[0], sep="\t", keep_default_na=False)
-    result_sub100 = pd.read_csv(result_sub100_list[0], sep="\t", keep_default_na=False)
-    result_sub1 = pd.read_csv(result_sub1_list[0], sep="\t", keep_default_na=False)
 
     expected_sub100 = pd.DataFrame(
         {
@@ -1,17 +1,31 @@
+import json
+import os
+from functools import cache
 from pathlib import Path
 from string import Template
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
+import clinica
 from clinica.iotools.bids_utils import (
+    BIDS_VALIDATOR_CONFIG,
     StudyName,
+    _build_dcm2niix_command,
+    _write_bids_dataset_description,
     _write_bids_validator_config,
     _write_bidsignore,
     _write_readme,
+    bids_id_factory,
+    create_participants_df,
+    get_bids_subjs_list,
+    remove_space_and_symbols,
+    write_modality_agnostic_files,
 )
+from clinica.utils.bids import BIDS_VERSION
 
 MODALITY_AGNOSTIC_FILE_WRITERS = {
     #    "readme": _write_readme,
@@ -42,7 +56,7 @@ EXPECTED_README_CONTENT = Template(
 
 
 @pytest.mark.parametrize(
-    "study,study_id,expected",
+    "study,source_id,bids_id",
     [
         (StudyName.ADNI, "001_S_0001", "sub-ADNI001S0001"),
         (StudyName.NIFD, "1_S_0001", "sub-NIFD1S0001"),
@@ -55,10 +69,11 @@ EXPECTED_README_CONTENT = Template(
         (StudyName.IXI, "IXI001", "sub-IXI001"),
     ],
 )
-def test_study_to_bids_id_passing(study, study_id, expected):
-    from clinica.iotools.bids_utils import bids_id_factory
+def test_bids_id_roundtrip(study, source_id, bids_id):
+    bids_id_class = bids_id_factory(study)
 
-    assert bids_id_factory(study).from_original_study_id(study_id) == expected
+    assert bids_id_class.from_original_study_id(source_id) == bids_id
+    assert bids_id_class(bids_id).to_original_study_id() == source_id
 
 
 @pytest.mark.parametrize(
@@ -86,32 +101,10 @@ def test_study_to_bids_id_passing(study, study_id, expected):
     ],
 )
 def test_study_to_bids_id_value_error(study, study_id):
-    from clinica.iotools.bids_utils import bids_id_factory
-
     with pytest.raises(ValueError):
         bids_id_factory(study).from_original_study_id(study_id)
 
 
-@pytest.mark.parametrize(
-    "study,source_id,bids_id",
-    [
-        (StudyName.ADNI, "001_S_0001", "sub-ADNI001S0001"),
-        (StudyName.NIFD, "1_S_0001", "sub-NIFD1S0001"),
-        (StudyName.AIBL, "10", "sub-AIBL10"),
-        (StudyName.UKB, "0101001", "sub-UKB0101001"),
-        (StudyName.GENFI, "MAPT009", "sub-MAPT009"),
-        (StudyName.OASIS3, "OAS30001", "sub-OAS30001"),
-        (StudyName.HABS, "P_INIBUB", "sub-HABSINIBUB"),
-        (StudyName.OASIS, "OAS1_0001_MR1", "sub-OASIS10001"),
-        (StudyName.IXI, "IXI001", "sub-IXI001"),
-    ],
-)
-def test_bids_to_study(study, bids_id, source_id):
-    from clinica.iotools.bids_utils import bids_id_factory
-
-    assert bids_id_factory(study)(bids_id).to_original_study_id() == source_id
-
-
 def create_participants_spec(tmp_path: Path) -> Path:
     spec_df = pd.DataFrame(
         {
@@ -205,94 +198,111 @@ def create_clinical_data(
     return clinical_path
 
 
+@pytest.fixture(scope="session")
+def participants_spec_dir(tmp_path_factory) -> Path:
+    return create_participants_spec(tmp_path_factory.mktemp("participants_spec"))
+
+
+@pytest.fixture(scope="session")
+def clinical_data_dirs(tmp_path_factory) -> Dict[Tuple[StudyName, bool], Path]:
+    """Clinical data folders built once for each (study, ADNI genotype) pair."""
+    return {
+        (study_name, adni_genotype): create_clinical_data(
+            tmp_path_factory.mktemp("clinical"), study_name, adni_genotype
+        )
+        for study_name, adni_genotype in (
+            (StudyName.OASIS, False),
+            (StudyName.ADNI, False),
+            (StudyName.ADNI, True),
+        )
+    }
+
+
 @pytest.mark.parametrize(
     "study_name, bids_ids, expected, adni_genotype",
     [
         (
             StudyName.OASIS,
             ["sub-OASIS10001"],
-            pd.DataFrame(
-                {
-                    "participant_id": ["sub-OASIS10001"],
-                    "alternative_id_1": ["OAS1_0001_MR1"],
-                    "sex": ["F"],
-                }
-            ),
+            {
+                "participant_id": ["sub-OASIS10001"],
+                "alternative_id_1": ["OAS1_0001_MR1"],
+                "sex": ["F"],
+            },
             False,
         ),
         (
             StudyName.ADNI,
             ["sub-ADNI001S0001"],
-            pd.DataFrame(
-                {
-                    "participant_id": ["sub-ADNI001S0001"],
-                    "alternative_id_1": ["001_S_0001"],
-                    "sex": ["Male"],
-                    "apoegen1": ["3"],
-                }
-            ),
+            {
+                "participant_id": ["sub-ADNI001S0001"],
+                "alternative_id_1": ["001_S_0001"],
+                "sex": ["Male"],
+                "apoegen1": ["3"],
+            },
             True,
         ),
         (
             StudyName.OASIS,
             ["sub-OASIS10002", "sub-OASIS10004", "sub-OASIS10007"],
-            pd.DataFrame(
-                {
-                    "participant_id": ["sub-OASIS10002", "sub-OASIS10004"],
-                    "alternative_id_1": ["OAS1_0002_MR1", "OAS1_0004_MR1"],
-                    "sex": ["M", "M"],
-                }
-            ),
+            {
+                "participant_id": ["sub-OASIS10002", "sub-OASIS10004"],
+                "alternative_id_1": ["OAS1_0002_MR1", "OAS1_0004_MR1"],
+                "sex": ["M", "M"],
+            },
             False,
         ),
         (
             StudyName.ADNI,
             ["sub-ADNI001S0005"],
-            pd.DataFrame(
-                {
-                    "participant_id": ["sub-ADNI001S0005"],
-                    "alternative_id_1": ["001_S_0005"],
-                    "sex": ["Female"],
-                    "apoegen1": ["n/a"],
-                }
-            ),
+            {
+                "participant_id": ["sub-ADNI001S0005"],
+                "alternative_id_1": ["001_S_0005"],
+                "sex": ["Female"],
+                "apoegen1": ["n/a"],
+            },
             False,
         ),
         (
             StudyName.ADNI,
             ["sub-ADNI001S0006"],
-            pd.DataFrame(
-                {
-                    "participant_id": ["sub-ADNI001S0006"],
-                    "alternative_id_1": ["001_S_0006"],
-                    "sex": ["n/a"],
-                    "apoegen1": [3.0],
-                }
-            ),
+            {
+                "participant_id": ["sub-ADNI001S0006"],
+                "alternative_id_1": ["001_S_0006"],
+                "sex": ["n/a"],
+                "apoegen1": [3.0],
+            },
             False,
         ),
     ],
+    ids=(
+        "OASIS subject",
+        "ADNI subject with genotype",
+        "OASIS subjects with one missing",
+        "ADNI subject with missing APOE",
+        "ADNI subject with missing sex",
+    ),
 )
 def test_create_participants_df(
-    tmp_path, bids_ids, expected, study_name, adni_genotype
+    participants_spec_dir,
+    clinical_data_dirs,
+    bids_ids,
+    expected,
+    study_name,
+    adni_genotype,
 ):
-    from clinica.iotools.bids_utils import create_participants_df
-
-    assert (
+    assert_frame_equal(
         create_participants_df(
             study_name,
-            clinical_specifications_folder=create_participants_spec(tmp_path),
-            clinical_data_dir=create_clinical_data(tmp_path, study_name, adni_genotype),
+            clinical_specifications_folder=participants_spec_dir,
+            clinical_data_dir=clinical_data_dirs[(study_name, adni_genotype)],
             bids_ids=bids_ids,
-        )
-        .reset_index(drop=True)
-        .equals(expected)
+        ).reset_index(drop=True),
+        pd.DataFrame(expected),
     )
 
 
 def test_get_bids_subjs_list(tmp_path):
-    from clinica.iotools.bids_utils import get_bids_subjs_list
-
     (tmp_path / "file").touch()
     (tmp_path / "sub-03").touch()
     (tmp_path / "folder").mkdir()
@@ -314,25 +324,30 @@ def test_get_bids_subjs_list(tmp_path):
     ],
 )
 def test_remove_space_and_symbols(input_string, expected):
-    from clinica.iotools.bids_utils import remove_space_and_symbols
-
     assert remove_space_and_symbols(input_string) == expected
 
 
 @pytest.mark.parametrize("compress", [True, False])
 @pytest.mark.parametrize("sidecar", [True, False])
 def test_build_dcm2niix_command(tmp_path, compress, sidecar):
-    from clinica.iotools.bids_utils import _build_dcm2niix_command
-
     compress_flag = "y" if compress else "n"
     sidecar_flag = "y" if sidecar else "n"
-    expected = ["dcm2niix", "-w", "0", "-f", "fmt", "-o", str(tmp_path / "out")]
-    if compress:
-        expected += ["-9"]
-    expected += ["-z", compress_flag, "-b", sidecar_flag]
-    if sidecar:
-        expected += ["-ba", "y"]
-    expected += [str(tmp_path / "in")]
+    expected = [
+        "dcm2niix",
+        "-w",
+        "0",
+        "-f",
+        "fmt",
+        "-o",
+        str(tmp_path / "out"),
+        *(["-9"] if compress else []),
+        "-z",
+        compress_flag,
+        "-b",
+        sidecar_flag,
+        *(["-ba", "y"] if sidecar else []),
+        str(tmp_path / "in"),
+    ]
     assert (
         _build_dcm2niix_command(
             tmp_path / "in",
@@ -347,25 +362,7 @@ def test_build_dcm2niix_command(tmp_path, compress, sidecar):
 
 def _validate_file_and_content(file: Path, expected_content: str) -> None:
     assert file.exists()
-    assert file.read_text() == expected_content
-
-
-@pytest.fixture
-def expected_description_content(
-    study_name: StudyName,
-    bids_version: Union[None, str],
-) -> str:
-    import json
-
-    from clinica.utils.bids import BIDS_VERSION
-
-    expected_version = BIDS_VERSION if bids_version is None else bids_version
-    desc_dict = {
-        "Name": study_name.value,
-        "BIDSVersion": str(expected_version),
-        "DatasetType": "raw",
-    }
-    return json.dumps(desc_dict, indent=4)
+    assert file.read_bytes() == expected_content.encode()
 
 
 @pytest.mark.parametrize("study_name", StudyName)
@@ -374,7 +371,6 @@ def test_write_bids_dataset_description(
     tmp_path,
     study_name,
     bids_version,
-    expected_description_content,
 ):
     """Test function `_write_bids_dataset_description`.
 
@@ -383,20 +379,18 @@ def test_write_bids_dataset_description(
         a different set of input parameters.
 
     """
-    from clinica.iotools.bids_utils import _write_bids_dataset_description
-
     _write_bids_dataset_description(study_name, tmp_path, bids_version=bids_version)
-    _validate_file_and_content(
-        tmp_path / EXPECTED_MODALITY_AGNOSTIC_FILES["description"],
-        expected_description_content,
-    )
-
+    description = tmp_path / EXPECTED_MODALITY_AGNOSTIC_FILES["description"]
 
-def expected_validator_content() -> str:
-    import json
+    assert json.loads(description.read_text()) == {
+        "Name": study_name.value,
+        "BIDSVersion": str(BIDS_VERSION) if bids_version is None else bids_version,
+        "DatasetType": "raw",
+    }
 
-    from clinica.iotools.bids_utils import BIDS_VALIDATOR_CONFIG
 
+@cache
+def expected_validator_content() -> str:
     return json.dumps(BIDS_VALIDATOR_CONFIG, indent=4)
 
 
@@ -423,17 +417,13 @@ def test_modality_agnostic_file_writers(
 
 def test_write_modality_agnostic_files(tmp_path):
     """Test function `write_modality_agnostic_files`."""
-    import os
-
-    from clinica.iotools.bids_utils import write_modality_agnostic_files
-
     data_dict = {"link": "", "desc": ""}
-    assert len(os.listdir(tmp_path)) == 0
+    with os.scandir(tmp_path) as entries:
+        assert not any(entries)
     write_modality_agnostic_files(StudyName.ADNI, data_dict, tmp_path)
-    files = os.listdir(tmp_path)
-    assert len(files) == 4
-    for _, v in EXPECTED_MODALITY_AGNOSTIC_FILES.items():
-        assert v in files
+    with os.scandir(tmp_path) as entries:
+        files = {entry.name for entry in entries}
+    assert files == set(EXPECTED_MODALITY_AGNOSTIC_FILES.values())
 
 
 @pytest.mark.parametrize("study_name", StudyName)
@@ -459,9 +449,8 @@ def test_write_bids_readme(
     )
 
 
+@cache
 def get_expected_readme_content(study_name: StudyName) -> str:
-    import clinica
-
     return EXPECTED_README_CONTENT.safe_substitute(
         version=clinica.__version__,
         website="https://www.clinica.run",